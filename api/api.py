@@ -9,14 +9,23 @@ Author: Global News API
 Date: 2025
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, request, jsonify, Response, stream_with_context, g, has_request_context
+from flask_compress import Compress
 import sqlite3
 from datetime import datetime, timedelta
-import json
-from typing import Dict, List, Optional, Tuple
+import orjson
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import logging
-from functools import wraps
+from functools import wraps, lru_cache
 import os
+import threading
+import atexit
+import weakref
+import itertools
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -24,22 +33,163 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 app.config['JSON_SORT_KEYS'] = False
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600  # Cache the static docs page for an hour
+
+# Response compression (Brotli preferred, gzip fallback)
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'application/x-ndjson']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_ALGORITHM_STREAMING'] = ['br', 'gzip', 'deflate']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
+
+# Encodings Flask-Compress may append to a response's ETag
+COMPRESS_ENCODINGS = frozenset(app.config['COMPRESS_ALGORITHM'] + app.config['COMPRESS_ALGORITHM_STREAMING'])
 
 # Database configuration
 DATABASE_PATH = 'news_database.db'
 
+# Run PRAGMA optimize on a pooled connection after this many checkouts
+OPTIMIZE_INTERVAL = 1000
+
+# Number of rows fetched from SQLite and encoded per chunk when streaming responses
+STREAM_BATCH_SIZE = 256
+
+# Seconds an aggregate (statistics, countries, sources, article counts) stays cached
+CACHE_TTL = 60
+CACHE_MAX_ENTRIES = 256
+
+# Response timestamps are reused for this many seconds
+TIMESTAMP_RESOLUTION = 0.1
+
+# Columns get_articles may sort by
+VALID_SORT_COLUMNS = ('publication_date', 'title', 'source', 'country', 'scraped_at')
+
+# Columns get_articles may return. summary is the bulkiest column and list
+# views rarely need it, so it is only returned when requested via fields.
+# id and publication_date are always returned since they form the keyset cursor.
+ARTICLE_FIELDS = ('id', 'title', 'publication_date', 'source', 'country',
+                  'summary', 'url', 'language', 'category', 'scraped_at')
+DEFAULT_ARTICLE_FIELDS = tuple(field for field in ARTICLE_FIELDS if field != 'summary')
+REQUIRED_ARTICLE_FIELDS = ('id', 'publication_date')
+
+# Single-article lookup; the SQL text never varies so its compiled statement is reused
+ARTICLE_BY_ID_QUERY = f"SELECT {', '.join(ARTICLE_FIELDS)} FROM news_articles WHERE id = ?"
+
+# Source listings, one fixed statement per shape. The full listing groups rows
+# straight off the covering idx_source_country; the per-country listing seeks
+# idx_country_pubdate and groups that country's rows in a temp b-tree. Both
+# sort the final counts in a temp b-tree, which no index can avoid.
+SOURCES_QUERY = """
+    SELECT source, country, COUNT(*) as article_count
+    FROM news_articles
+    GROUP BY source, country
+    ORDER BY article_count DESC
+"""
+SOURCES_BY_COUNTRY_QUERY = """
+    SELECT source, country, COUNT(*) as article_count
+    FROM news_articles
+    WHERE country = ?
+    GROUP BY source
+    ORDER BY article_count DESC
+"""
+
+# Number of articles kept in NewsAPI's by-id cache (articles don't change once stored)
+ARTICLE_CACHE_SIZE = 4096
+
+# get_articles filters, in parameter order, and the WHERE condition for each.
+# publication_date is stored as 'YYYY-MM-DD HH:MM:SS', so plain string
+# comparisons keep the column bare and let SQLite seek the index.
+ARTICLE_FILTERS = ('country', 'source', 'language', 'date_from', 'date_to', 'search')
+ARTICLE_FILTER_CONDITIONS = (
+    "country = ?",
+    "source = ?",
+    "language = ?",
+    "publication_date >= date(?)",
+    "publication_date < date(?, '+1 day')",
+    "id IN (SELECT rowid FROM news_fts WHERE news_fts MATCH ?)",
+)
+
+@lru_cache(maxsize=256)
+def build_article_queries(active_filters: Tuple[bool, ...], keyset: bool,
+                          sort_by: str, sort_order: str,
+                          columns: Tuple[str, ...] = DEFAULT_ARTICLE_FIELDS) -> Tuple[str, str]:
+    """
+    Build the (count_sql, page_sql) pair for one shape of get_articles query
+    
+    Only the shape (which filters are present, keyset mode, sort and selected
+    columns) affects the SQL text, so it is memoized: repeat requests skip
+    string assembly and send identical SQL, which hits sqlite3's prepared
+    statement cache. sort_by, sort_order and columns must already be validated.
+    """
+    conditions = [condition for condition, active
+                  in zip(ARTICLE_FILTER_CONDITIONS, active_filters) if active]
+    
+    # Keyset pagination: seek past the (publication_date, id) cursor
+    if keyset:
+        comparison = '<' if sort_order == 'DESC' else '>'
+        conditions.append(f"(publication_date, id) {comparison} (?, ?)")
+    
+    where_clause = " AND ".join(conditions) if conditions else "1=1"
+    
+    count_query = f"SELECT COUNT(*) FROM news_articles WHERE {where_clause}"
+    
+    # Kept apart from the count so the index can deliver rows already in
+    # order and SQLite stops reading once the page is full
+    page_query = f"""
+        SELECT {', '.join(columns)}
+        FROM news_articles 
+        WHERE {where_clause}
+        ORDER BY {sort_by} {sort_order}, id {sort_order}
+        LIMIT ? OFFSET ?
+    """
+    
+    return count_query, page_query
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Optimize and close a pooled connection"""
+    try:
+        conn.execute("PRAGMA optimize")
+        conn.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Error closing database connection: {e}")
+
+class _PooledConnection:
+    """A thread's pooled connection, closed when the owning thread exits"""
+    
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.uses = 0
+        self.close = weakref.finalize(self, _close_connection, conn)
+
 class NewsAPI:
     """API class for handling news database operations"""
     
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._article_cache = OrderedDict()
+        self._article_cache_lock = threading.Lock()
         self._ensure_database_exists()
+        atexit.register(self.close_connections)
     
     def _ensure_database_exists(self):
         """Ensure the database exists and is properly structured"""
         if not os.path.exists(self.db_path):
             logger.warning(f"Database {self.db_path} not found. Creating empty database.")
             self._create_empty_database()
+        self._enable_wal()
+        self._create_indexes()
+        self._create_search_index()
+        self._create_stats_tables()
+        self._create_version_table()
+        self._analyze()
+        self._verify_plans()
     
     def _create_empty_database(self):
         """Create an empty database with proper schema"""
@@ -56,17 +206,298 @@ class NewsAPI:
                     url TEXT UNIQUE NOT NULL,
                     language TEXT,
                     category TEXT,
-                    hash TEXT UNIQUE,
+                    hash INTEGER UNIQUE,
                     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             conn.commit()
     
+    def _enable_wal(self):
+        """Switch the database to WAL so readers are not blocked by scraper writes"""
+        # journal_mode is persistent, so this only needs to run once per database
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+    
+    def _create_indexes(self):
+        """Create composite indexes matching the filter + sort shapes used by the API"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript('''
+                CREATE INDEX IF NOT EXISTS idx_date ON news_articles(publication_date);
+                -- Created by older scrapers; left-prefixes of the composite indexes below
+                DROP INDEX IF EXISTS idx_country;
+                DROP INDEX IF EXISTS idx_source;
+                CREATE INDEX IF NOT EXISTS idx_country_pubdate ON news_articles(country, publication_date);
+                CREATE INDEX IF NOT EXISTS idx_source_pubdate ON news_articles(source, publication_date);
+                CREATE INDEX IF NOT EXISTS idx_language_pubdate ON news_articles(language, publication_date);
+                CREATE INDEX IF NOT EXISTS idx_scraped_at ON news_articles(scraped_at);
+                CREATE INDEX IF NOT EXISTS idx_source_country ON news_articles(source, country);
+            ''')
+            conn.commit()
+    
+    def _create_search_index(self):
+        """Create the FTS5 index over titles and summaries, kept in sync by triggers"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'"
+            )
+            needs_rebuild = cursor.fetchone() is None
+            
+            conn.executescript('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
+                    title,
+                    summary,
+                    content='news_articles',
+                    content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2',
+                    prefix='2 3 4'
+                );
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_ai AFTER INSERT ON news_articles BEGIN
+                    INSERT INTO news_fts(rowid, title, summary)
+                    VALUES (new.id, new.title, new.summary);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_ad AFTER DELETE ON news_articles BEGIN
+                    INSERT INTO news_fts(news_fts, rowid, title, summary)
+                    VALUES ('delete', old.id, old.title, old.summary);
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_au AFTER UPDATE ON news_articles BEGIN
+                    INSERT INTO news_fts(news_fts, rowid, title, summary)
+                    VALUES ('delete', old.id, old.title, old.summary);
+                    INSERT INTO news_fts(rowid, title, summary)
+                    VALUES (new.id, new.title, new.summary);
+                END;
+            ''')
+            
+            # Index articles that were stored before the FTS table existed
+            if needs_rebuild:
+                logger.info("Building full-text search index")
+                conn.execute("INSERT INTO news_fts(news_fts) VALUES('rebuild')")
+            conn.commit()
+    
+    def _create_stats_tables(self):
+        """
+        Create per-country/source/language/day article counts kept in sync by triggers
+        
+        get_statistics reads these small tables instead of running GROUP BY
+        scans over news_articles; the scraper pays a few upserts per insert.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            # Check and populate in one write transaction so concurrent workers
+            # starting up together can't count existing articles twice
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'stats_country'"
+            )
+            if cursor.fetchone() is not None:
+                conn.execute("COMMIT")
+                return
+            
+            logger.info("Building statistics summary tables")
+            for table, column in (('stats_country', 'country'), ('stats_source', 'source'),
+                                  ('stats_language', 'language'), ('stats_daily', 'date')):
+                conn.execute(f"CREATE TABLE {table} ({column} TEXT PRIMARY KEY, cnt INTEGER NOT NULL)")
+            
+            conn.execute('''
+                CREATE TRIGGER news_articles_stats_ai AFTER INSERT ON news_articles BEGIN
+                    INSERT INTO stats_country(country, cnt) VALUES (new.country, 1)
+                        ON CONFLICT(country) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_source(source, cnt) VALUES (new.source, 1)
+                        ON CONFLICT(source) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_language(language, cnt) VALUES (COALESCE(new.language, 'unknown'), 1)
+                        ON CONFLICT(language) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_daily(date, cnt)
+                        SELECT date(new.publication_date), 1 WHERE date(new.publication_date) IS NOT NULL
+                        ON CONFLICT(date) DO UPDATE SET cnt = cnt + 1;
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER news_articles_stats_ad AFTER DELETE ON news_articles BEGIN
+                    UPDATE stats_country SET cnt = cnt - 1 WHERE country = old.country;
+                    UPDATE stats_source SET cnt = cnt - 1 WHERE source = old.source;
+                    UPDATE stats_language SET cnt = cnt - 1 WHERE language = COALESCE(old.language, 'unknown');
+                    UPDATE stats_daily SET cnt = cnt - 1 WHERE date = date(old.publication_date);
+                END
+            ''')
+            conn.execute('''
+                CREATE TRIGGER news_articles_stats_au
+                AFTER UPDATE OF country, source, language, publication_date ON news_articles BEGIN
+                    UPDATE stats_country SET cnt = cnt - 1 WHERE country = old.country;
+                    UPDATE stats_source SET cnt = cnt - 1 WHERE source = old.source;
+                    UPDATE stats_language SET cnt = cnt - 1 WHERE language = COALESCE(old.language, 'unknown');
+                    UPDATE stats_daily SET cnt = cnt - 1 WHERE date = date(old.publication_date);
+                    INSERT INTO stats_country(country, cnt) VALUES (new.country, 1)
+                        ON CONFLICT(country) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_source(source, cnt) VALUES (new.source, 1)
+                        ON CONFLICT(source) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_language(language, cnt) VALUES (COALESCE(new.language, 'unknown'), 1)
+                        ON CONFLICT(language) DO UPDATE SET cnt = cnt + 1;
+                    INSERT INTO stats_daily(date, cnt)
+                        SELECT date(new.publication_date), 1 WHERE date(new.publication_date) IS NOT NULL
+                        ON CONFLICT(date) DO UPDATE SET cnt = cnt + 1;
+                END
+            ''')
+            
+            # Seed the counts from articles stored before the tables existed
+            conn.execute('''
+                INSERT INTO stats_country(country, cnt)
+                SELECT country, COUNT(*) FROM news_articles GROUP BY country
+            ''')
+            conn.execute('''
+                INSERT INTO stats_source(source, cnt)
+                SELECT source, COUNT(*) FROM news_articles GROUP BY source
+            ''')
+            conn.execute('''
+                INSERT INTO stats_language(language, cnt)
+                SELECT COALESCE(language, 'unknown'), COUNT(*) FROM news_articles GROUP BY 1
+            ''')
+            conn.execute('''
+                INSERT INTO stats_daily(date, cnt)
+                SELECT date(publication_date), COUNT(*) FROM news_articles
+                WHERE date(publication_date) IS NOT NULL GROUP BY 1
+            ''')
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+    
+    def _create_version_table(self):
+        """Create the change counter behind get_data_version, bumped by triggers on every write"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executescript('''
+                CREATE TABLE IF NOT EXISTS articles_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO articles_version (id, version) VALUES (1, 0);
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_version_ai AFTER INSERT ON news_articles BEGIN
+                    UPDATE articles_version SET version = version + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_version_ad AFTER DELETE ON news_articles BEGIN
+                    UPDATE articles_version SET version = version + 1;
+                END;
+                
+                CREATE TRIGGER IF NOT EXISTS news_articles_version_au AFTER UPDATE ON news_articles BEGIN
+                    UPDATE articles_version SET version = version + 1;
+                END;
+            ''')
+            conn.commit()
+    
+    def _analyze(self):
+        """Gather table statistics so the query planner can judge index selectivity"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                conn.execute("ANALYZE")
+            else:
+                conn.execute("PRAGMA optimize")
+            conn.commit()
+    
+    def _verify_plans(self) -> bool:
+        """
+        Log an error for article query plans that scan news_articles or sort in a temp b-tree
+        
+        Returns:
+            True if every plan passes
+        """
+        all_ok = True
+        with sqlite3.connect(self.db_path) as conn:
+            for active_filters in itertools.product((False, True), repeat=len(ARTICLE_FILTERS)):
+                description = ' + '.join(name for name, active in zip(ARTICLE_FILTERS, active_filters)
+                                         if active) or 'no'
+                params = ['"x"*' if name == 'search' else 'x'
+                          for name, active in zip(ARTICLE_FILTERS, active_filters) if active]
+                
+                for keyset, sort_order in itertools.product((False, True), ('DESC', 'ASC')):
+                    count_query, page_query = build_article_queries(active_filters, keyset,
+                                                                    'publication_date', sort_order)
+                    query_params = params + ['x', 1] if keyset else params
+                    
+                    plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {count_query}", query_params)]
+                    plan += [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {page_query}",
+                                                            query_params + [1, 0])]
+                    # Full-text matches come back in rowid order, so search always sorts
+                    problems = [detail for detail in plan
+                                if (detail.startswith('SCAN') and 'news_articles' in detail
+                                    and (any(active_filters) or keyset))
+                                or ('TEMP B-TREE' in detail and not active_filters[-1])]
+                    
+                    shape = f"{description} filter ({'keyset' if keyset else 'offset'}, {sort_order})"
+                    if problems:
+                        all_ok = False
+                        logger.error(f"Query plan for {shape} scans or sorts news_articles: {plan}")
+                    else:
+                        logger.debug(f"Query plan for {shape}: {plan}")
+        return all_ok
+    
+    @staticmethod
+    def _build_fts_query(text: str) -> str:
+        """
+        Convert free-form user input into a safe FTS5 MATCH expression
+        
+        Every token is quoted so characters such as '-', ':' or keywords
+        like OR are treated as plain text, and matched as a prefix.
+        """
+        tokens = text.split()
+        if not tokens:
+            return '""'  # Empty phrase: valid syntax that matches nothing
+        return " ".join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+    
     def get_connection(self):
-        """Get database connection with Row factory"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        """Get this thread's pooled read-only connection, opening it on first use"""
+        pooled = getattr(self._local, 'pooled', None)
+        if pooled is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            conn.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped I/O
+            conn.execute("PRAGMA temp_store=MEMORY")
+            pooled = _PooledConnection(conn)
+            self._local.pooled = pooled
+            self._connections.add(pooled)
+        
+        pooled.uses += 1
+        if pooled.uses % OPTIMIZE_INTERVAL == 0:
+            pooled.conn.execute("PRAGMA optimize")
+        
+        return pooled.conn
+    
+    def close_connections(self):
+        """Close every pooled connection (registered to run at exit)"""
+        for pooled in list(self._connections):
+            pooled.close()
+        self._local = threading.local()
+    
+    @staticmethod
+    def _fetch_in_batches(cursor: sqlite3.Cursor) -> Iterator[tuple]:
+        """
+        Yield cursor rows, fetching STREAM_BATCH_SIZE rows at a time
+        
+        Peak memory stays bounded by one batch however large the page is,
+        while avoiding a round trip into the sqlite3 module per row.
+        """
+        while True:
+            batch = cursor.fetchmany(STREAM_BATCH_SIZE)
+            if not batch:
+                return
+            yield from batch
+    
+    @classmethod
+    def _iter_dicts(cls, cursor: sqlite3.Cursor) -> Iterator[Dict]:
+        """Lazily convert cursor rows to dicts without materializing the result set"""
+        columns = [column[0] for column in cursor.description]
+        for row in cls._fetch_in_batches(cursor):
+            yield dict(zip(columns, row))
     
     def get_articles(self, 
                     country: Optional[str] = None,
@@ -78,133 +509,180 @@ class NewsAPI:
                     limit: int = 100,
                     offset: int = 0,
                     sort_by: str = 'publication_date',
-                    sort_order: str = 'DESC') -> Tuple[List[Dict], int]:
+                    sort_order: str = 'DESC',
+                    after_date: Optional[str] = None,
+                    after_id: Optional[int] = None,
+                    fields: Optional[Sequence[str]] = None,
+                    with_count: bool = True) -> Tuple[Iterator[Dict], Optional[int]]:
         """
         Get articles with filtering and pagination
         
+        Passing both after_date and after_id switches to keyset pagination:
+        results are ordered by (publication_date, id) and start right after
+        that position, so deep pages cost the same as the first one. offset
+        and sort_by are ignored in this mode.
+        
+        fields selects the returned columns (see ARTICLE_FIELDS); unknown
+        names are ignored and by default every column except summary is
+        returned.
+        
         Returns:
-            Tuple of (articles_list, total_count)
+            Tuple of (articles_iterator, total_count); articles are read from
+            the cursor lazily as the iterator is consumed. total_count is
+            cached until the data changes, and is None with keyset pagination
+            or when with_count is False.
         """
-        query_conditions = []
-        query_params = []
+        # Filter values in ARTICLE_FILTER_CONDITIONS order
+        filter_values = (
+            country,
+            source,
+            language,
+            date_from,
+            date_to,
+            self._build_fts_query(search) if search else None
+        )
+        active_filters = tuple(bool(value) for value in filter_values)
+        query_params = [value for value in filter_values if value]
         
-        # Build WHERE clause
-        if country:
-            query_conditions.append("country = ?")
-            query_params.append(country)
+        # Validate sort parameters
+        if sort_by not in VALID_SORT_COLUMNS:
+            sort_by = 'publication_date'
         
-        if source:
-            query_conditions.append("source = ?")
-            query_params.append(source)
+        sort_order = sort_order.upper()
+        if sort_order not in ['ASC', 'DESC']:
+            sort_order = 'DESC'
         
-        if language:
-            query_conditions.append("language = ?")
-            query_params.append(language)
+        keyset = after_date is not None and after_id is not None
+        if keyset:
+            sort_by = 'publication_date'
+            query_params.extend([after_date, after_id])
+            offset = 0
         
-        if date_from:
-            query_conditions.append("date(publication_date) >= date(?)")
-            query_params.append(date_from)
+        # Validate requested columns, keeping ARTICLE_FIELDS order
+        requested = set(fields or ()) & set(ARTICLE_FIELDS)
+        if requested:
+            columns = tuple(field for field in ARTICLE_FIELDS
+                            if field in requested or field in REQUIRED_ARTICLE_FIELDS)
+        else:
+            columns = DEFAULT_ARTICLE_FIELDS
         
-        if date_to:
-            query_conditions.append("date(publication_date) <= date(?)")
-            query_params.append(date_to)
+        count_query, articles_query = build_article_queries(active_filters, keyset, sort_by, sort_order, columns)
         
-        if search:
-            query_conditions.append("(title LIKE ? OR summary LIKE ?)")
-            search_term = f"%{search}%"
-            query_params.extend([search_term, search_term])
+        conn = self.get_connection()
         
-        # Build base query
-        where_clause = " AND ".join(query_conditions) if query_conditions else "1=1"
+        total_count = None
+        if with_count and not keyset:
+            total_count = self._cached(
+                ('count', count_query, tuple(query_params)),
+                lambda: conn.execute(count_query, query_params).fetchone()[0])
         
-        # Validate sort parameters
-        valid_sort_columns = ['publication_date', 'title', 'source', 'country', 'scraped_at']
-        if sort_by not in valid_sort_columns:
-            sort_by = 'publication_date'
+        cursor = conn.execute(articles_query, query_params + [limit, offset])
+        articles = self._iter_dicts(cursor)
         
-        if sort_order.upper() not in ['ASC', 'DESC']:
-            sort_order = 'DESC'
+        return articles, total_count
+    
+    def get_article_by_id(self, article_id: int) -> Optional[Dict]:
+        """Get a single article by ID, served from an LRU cache when possible"""
+        with self._article_cache_lock:
+            article = self._article_cache.get(article_id)
+            if article is not None:
+                self._article_cache.move_to_end(article_id)
+                return article
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) FROM news_articles WHERE {where_clause}"
+        # Plain tuples skip building a sqlite3.Row for this single-row lookup
+        cursor = self.get_connection().cursor()
+        cursor.row_factory = None
+        row = cursor.execute(ARTICLE_BY_ID_QUERY, (article_id,)).fetchone()
+        if row is None:
+            return None  # Misses aren't cached: the id may be inserted later
         
-        # Get articles with pagination
-        articles_query = f"""
-            SELECT id, title, publication_date, source, country, summary, url, language, category, scraped_at
-            FROM news_articles 
-            WHERE {where_clause}
-            ORDER BY {sort_by} {sort_order}
-            LIMIT ? OFFSET ?
-        """
+        article = dict(zip(ARTICLE_FIELDS, row))
+        with self._article_cache_lock:
+            self._article_cache[article_id] = article
+            if len(self._article_cache) > ARTICLE_CACHE_SIZE:
+                self._article_cache.popitem(last=False)
+        return article
+    
+    def get_data_version(self) -> str:
+        """Get a fingerprint of the stored articles and today's date, read once per request"""
+        if has_request_context() and 'data_version' in g:
+            return g.data_version
         
-        with self.get_connection() as conn:
-            # Get total count
-            cursor = conn.execute(count_query, query_params)
-            total_count = cursor.fetchone()[0]
-            
-            # Get articles
-            cursor = conn.execute(articles_query, query_params + [limit, offset])
-            articles = [dict(row) for row in cursor.fetchall()]
+        conn = self.get_connection()
+        version, today = conn.execute("SELECT version, DATE('now') FROM articles_version").fetchone()
+        data_version = hashlib.sha1(f"{version}|{today}".encode()).hexdigest()
         
-        return articles, total_count
+        if has_request_context():
+            g.data_version = data_version
+        return data_version
     
-    def get_article_by_id(self, article_id: int) -> Optional[Dict]:
-        """Get a single article by ID"""
-        query = "SELECT * FROM news_articles WHERE id = ?"
+    def _cached(self, key, compute: Callable[[], object]):
+        """Return a cached aggregate, recomputing it when stale or when the data changed"""
+        version = self.get_data_version()
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry and entry[0] == version and entry[2] > now:
+            return entry[1]
         
-        with self.get_connection() as conn:
-            cursor = conn.execute(query, (article_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        value = compute()
+        with self._cache_lock:
+            # Keys include user-supplied filters, so keep the cache bounded
+            if len(self._cache) >= CACHE_MAX_ENTRIES:
+                self._cache.clear()
+            self._cache[key] = (version, value, now + CACHE_TTL)
+        return value
     
     def get_statistics(self) -> Dict:
         """Get comprehensive statistics about the news database"""
-        with self.get_connection() as conn:
-            # Total articles
-            cursor = conn.execute("SELECT COUNT(*) FROM news_articles")
-            total_articles = cursor.fetchone()[0]
-            
-            # Articles by country
-            cursor = conn.execute("""
-                SELECT country, COUNT(*) as count 
-                FROM news_articles 
-                GROUP BY country 
-                ORDER BY count DESC
-            """)
-            countries = [{'country': row[0], 'count': row[1]} for row in cursor.fetchall()]
-            
-            # Articles by source
-            cursor = conn.execute("""
-                SELECT source, COUNT(*) as count 
-                FROM news_articles 
-                GROUP BY source 
-                ORDER BY count DESC
-                LIMIT 20
-            """)
-            sources = [{'source': row[0], 'count': row[1]} for row in cursor.fetchall()]
-            
-            # Articles by language
-            cursor = conn.execute("""
-                SELECT language, COUNT(*) as count 
-                FROM news_articles 
-                GROUP BY language 
-                ORDER BY count DESC
-            """)
-            languages = [{'language': row[0], 'count': row[1]} for row in cursor.fetchall()]
-            
-            # Recent activity (last 7 days)
-            cursor = conn.execute("""
-                SELECT DATE(publication_date) as date, COUNT(*) as count
-                FROM news_articles 
-                WHERE DATE(publication_date) >= DATE('now', '-7 days')
-                GROUP BY DATE(publication_date)
-                ORDER BY date DESC
-            """)
-            recent_activity = [{'date': row[0], 'count': row[1]} for row in cursor.fetchall()]
-            
-            # Latest scraping time
-            cursor = conn.execute("SELECT MAX(scraped_at) FROM news_articles")
-            latest_scrape = cursor.fetchone()[0]
+        return self._cached('statistics', self._compute_statistics)
+    
+    def _compute_statistics(self) -> Dict:
+        """Read the trigger-maintained summary tables behind get_statistics"""
+        conn = self.get_connection()
+        # Articles by country
+        cursor = conn.execute("""
+            SELECT country, cnt as count 
+            FROM stats_country 
+            WHERE cnt > 0 
+            ORDER BY count DESC
+        """)
+        countries = [{'country': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        
+        # Total articles
+        total_articles = sum(country['count'] for country in countries)
+        
+        # Articles by source
+        cursor = conn.execute("""
+            SELECT source, cnt as count 
+            FROM stats_source 
+            WHERE cnt > 0 
+            ORDER BY count DESC
+            LIMIT 20
+        """)
+        sources = [{'source': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        
+        # Articles by language
+        cursor = conn.execute("""
+            SELECT language, cnt as count 
+            FROM stats_language 
+            WHERE cnt > 0 
+            ORDER BY count DESC
+        """)
+        languages = [{'language': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        
+        # Recent activity (last 7 days)
+        cursor = conn.execute("""
+            SELECT date, cnt as count
+            FROM stats_daily 
+            WHERE date >= DATE('now', '-7 days') AND cnt > 0
+            ORDER BY date DESC
+        """)
+        recent_activity = [{'date': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        
+        # Latest scraping time
+        cursor = conn.execute("SELECT MAX(scraped_at) FROM news_articles")
+        latest_scrape = cursor.fetchone()[0]
         
         return {
             'total_articles': total_articles,
@@ -217,27 +695,52 @@ class NewsAPI:
             'unique_sources': len(sources)
         }
     
-    def search_articles(self, query: str, limit: int = 50) -> List[Dict]:
-        """Full-text search in articles"""
+    def get_countries(self) -> List[Dict]:
+        """Get available countries with their article counts"""
+        def compute():
+            conn = self.get_connection()
+            cursor = conn.execute("""
+                SELECT country, cnt as article_count 
+                FROM stats_country 
+                WHERE cnt > 0 
+                ORDER BY article_count DESC
+            """)
+            return [{'country': row[0], 'article_count': row[1]} for row in cursor.fetchall()]
+        
+        return self._cached('countries', compute)
+    
+    def get_sources(self, country: Optional[str] = None) -> List[Dict]:
+        """Get available news sources with their article counts, optionally for one country"""
+        def compute():
+            conn = self.get_connection()
+            if country:
+                cursor = conn.execute(SOURCES_BY_COUNTRY_QUERY, (country,))
+            else:
+                cursor = conn.execute(SOURCES_QUERY)
+            return [{'source': row[0], 'country': row[1], 'article_count': row[2]} 
+                    for row in cursor.fetchall()]
+        
+        return self._cached(('sources', country), compute)
+    
+    def search_articles(self, query: str, limit: int = 50) -> Iterator[Dict]:
+        """Full-text search in articles, yielding matches lazily"""
+        # bm25() is lower-is-better, so negate it to keep higher scores first.
+        # Title matches are weighted 3x relative to summary matches.
         search_query = """
-            SELECT id, title, publication_date, source, country, summary, url, language,
-                   CASE 
-                       WHEN title LIKE ? THEN 3
-                       WHEN summary LIKE ? THEN 2
-                       ELSE 1
-                   END as relevance_score
-            FROM news_articles 
-            WHERE title LIKE ? OR summary LIKE ?
-            ORDER BY relevance_score DESC, publication_date DESC
+            SELECT a.id, a.title, a.publication_date, a.source, a.country, a.summary, a.url, a.language,
+                   -bm25(news_fts, 3.0, 1.0) as relevance_score
+            FROM news_fts
+            JOIN news_articles a ON a.id = news_fts.rowid
+            WHERE news_fts MATCH ?
+            ORDER BY relevance_score DESC, a.publication_date DESC
             LIMIT ?
         """
         
-        search_term = f"%{query}%"
-        params = [search_term, search_term, search_term, search_term, limit]
+        params = [self._build_fts_query(query), limit]
         
-        with self.get_connection() as conn:
-            cursor = conn.execute(search_query, params)
-            return [dict(row) for row in cursor.fetchall()]
+        conn = self.get_connection()
+        cursor = conn.execute(search_query, params)
+        return self._iter_dicts(cursor)
 
 # Initialize API
 news_api = NewsAPI()
@@ -257,6 +760,53 @@ def handle_errors(f):
     return decorated_function
 
 # Helper functions
+@dataclass
+class ArticleQuery:
+    """Validated query parameters for /api/articles, matching NewsAPI.get_articles"""
+    country: Optional[str] = None
+    source: Optional[str] = None
+    language: Optional[str] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    search: Optional[str] = None
+    limit: int = 100
+    offset: int = 0
+    sort_by: str = 'publication_date'
+    sort_order: str = 'DESC'
+    after_date: Optional[str] = None
+    after_id: Optional[int] = None
+    fields: Optional[List[str]] = None
+    
+    STR_PARAMS = ('country', 'source', 'language', 'date_from', 'date_to', 'search',
+                  'sort_by', 'sort_order', 'after_date')
+    INT_PARAMS = ('limit', 'offset', 'after_id')
+    
+    def __post_init__(self):
+        self.limit = min(max(1, self.limit), 1000)  # Between 1 and 1000
+        self.offset = max(0, self.offset)  # Non-negative
+    
+    @property
+    def keyset(self) -> bool:
+        """Whether a keyset pagination cursor was supplied"""
+        return self.after_date is not None and self.after_id is not None
+    
+    @classmethod
+    def from_args(cls, args) -> 'ArticleQuery':
+        """Parse request args in one pass; malformed values fall back to defaults"""
+        values = {name: args[name] for name in cls.STR_PARAMS if name in args}
+        
+        for name in cls.INT_PARAMS:
+            if name in args:
+                try:
+                    values[name] = int(args[name])
+                except ValueError:
+                    pass
+        
+        if args.get('fields'):
+            values['fields'] = [field.strip() for field in args['fields'].split(',')]
+        
+        return cls(**values)
+
 def get_query_param(param_name: str, default_value=None, param_type=str):
     """Get query parameter with type conversion"""
     value = request.args.get(param_name, default_value)
@@ -273,150 +823,200 @@ def get_query_param(param_name: str, default_value=None, param_type=str):
     except (ValueError, TypeError):
         return default_value
 
+_timestamp_cache = {'value': '', 'expires': 0.0}
+
+def current_timestamp() -> str:
+    """Get the current time in ISO format, recomputed at most every TIMESTAMP_RESOLUTION seconds"""
+    now = time.monotonic()
+    if now >= _timestamp_cache['expires']:
+        _timestamp_cache['value'] = datetime.now().isoformat()
+        _timestamp_cache['expires'] = now + TIMESTAMP_RESOLUTION
+    return _timestamp_cache['value']
+
 def format_response(data, message: str = "Success", status_code: int = 200):
     """Format API response consistently"""
     response = {
         'status': 'success' if status_code < 400 else 'error',
         'message': message,
         'data': data,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': current_timestamp()
     }
-    return jsonify(response), status_code
+    return Response(orjson.dumps(response), mimetype='application/json'), status_code
+
+def stream_response(rows: Iterable[Dict], message: str, data: Optional[Dict] = None,
+                    rows_key: Optional[str] = None, count_key: Optional[str] = None,
+                    trailing_data: Optional[Callable[[], Dict]] = None):
+    """
+    Stream a response in the same envelope as format_response
+    
+    Rows are encoded in batches as they are read from the database cursor,
+    so a large page is never held in memory as a list before serialization.
+    
+    Args:
+        rows: Iterable of row dicts
+        message: Response message; may reference the streamed row count as {count}
+        data: Extra fields for the data object (requires rows_key)
+        rows_key: Key of the rows list inside data; if None, data is the list itself
+        count_key: Optional key under which the streamed row count is added to data
+        trailing_data: Optional callable returning extra data fields; it is
+            called after all rows have been streamed
+    """
+    def generate():
+        if rows_key is None:
+            yield b'{"data":['
+        else:
+            fields = orjson.dumps(data or {})[1:-1]
+            yield b'{"data":{' + (fields + b',' if fields else b'') + orjson.dumps(rows_key) + b':['
+        
+        count = 0
+        batch = []
+        for row in rows:
+            batch.append(orjson.dumps(row))
+            if len(batch) == STREAM_BATCH_SIZE:
+                yield (b',' if count else b'') + b','.join(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            yield (b',' if count else b'') + b','.join(batch)
+            count += len(batch)
+        yield b']'
+        
+        if rows_key is not None:
+            if count_key:
+                yield b',' + orjson.dumps(count_key) + b':' + str(count).encode()
+            if trailing_data is not None:
+                fields = orjson.dumps(trailing_data())[1:-1]
+                if fields:
+                    yield b',' + fields
+            yield b'}'
+        
+        trailer = {
+            'message': message.format(count=count),
+            'status': 'success',
+            'timestamp': current_timestamp()
+        }
+        yield b',' + orjson.dumps(trailer)[1:]
+    
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+def stream_ndjson(rows: Iterable[Dict]):
+    """
+    Stream rows as newline-delimited JSON, one record per line
+    
+    There is no envelope, so clients can process each record as soon as
+    its line arrives.
+    """
+    def generate():
+        batch = []
+        for row in rows:
+            batch.append(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+            if len(batch) == STREAM_BATCH_SIZE:
+                yield b''.join(batch)
+                batch = []
+        if batch:
+            yield b''.join(batch)
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def matching_etag(etag: str) -> Optional[str]:
+    """Find the If-None-Match value matching etag, ignoring Flask-Compress's ':<encoding>' suffix"""
+    if request.if_none_match.star_tag:
+        return etag
+    for client_etag in request.if_none_match.as_set(include_weak=True):
+        base, _, encoding = client_etag.rpartition(':')
+        if client_etag == etag or (base == etag and encoding in COMPRESS_ENCODINGS):
+            return client_etag
+    return None
+
+def format_cached_response(data_loader: Callable[[], object], message: str):
+    """
+    Format a response tagged with the data version, or a 304 without calling data_loader
+    
+    For list data, message may reference the number of items as {count}.
+    """
+    etag = news_api.get_data_version()
+    client_etag = matching_etag(etag)
+    if client_etag is not None:
+        response = Response(status=304)
+        response.set_etag(client_etag)
+        return response
+    
+    data = data_loader()
+    if isinstance(data, list):
+        message = message.format(count=len(data))
+    
+    response, status_code = format_response(data, message)
+    response.set_etag(etag)
+    return response, status_code
 
 # API Routes
 
 @app.route('/')
 def index():
     """API documentation and welcome page"""
-    html_template = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Global News API</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; line-height: 1.6; }
-            .endpoint { background: #f4f4f4; padding: 15px; margin: 10px 0; border-radius: 5px; }
-            .method { color: #fff; padding: 5px 10px; border-radius: 3px; font-weight: bold; }
-            .get { background: #61affe; }
-            .post { background: #49cc90; }
-            code { background: #f4f4f4; padding: 2px 4px; border-radius: 3px; }
-        </style>
-    </head>
-    <body>
-        <h1>🌍 Global News RSS Scraper API</h1>
-        <p>RESTful API for accessing scraped news data from around the world.</p>
-        
-        <h2>📋 Available Endpoints</h2>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/articles</strong>
-            <p>Get articles with filtering and pagination</p>
-            <p><strong>Parameters:</strong> country, source, language, date_from, date_to, search, limit, offset, sort_by, sort_order</p>
-        </div>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/articles/{id}</strong>
-            <p>Get a specific article by ID</p>
-        </div>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/search</strong>
-            <p>Search articles by keyword</p>
-            <p><strong>Parameters:</strong> q (query), limit</p>
-        </div>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/statistics</strong>
-            <p>Get comprehensive statistics about the news database</p>
-        </div>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/countries</strong>
-            <p>Get list of available countries</p>
-        </div>
-        
-        <div class="endpoint">
-            <span class="method get">GET</span> <strong>/api/sources</strong>
-            <p>Get list of available news sources</p>
-        </div>
-        
-        <h2>🔍 Example Requests</h2>
-        <ul>
-            <li><code>/api/articles?country=United%20States&limit=10</code></li>
-            <li><code>/api/articles?source=BBC%20News&date_from=2025-05-01</code></li>
-            <li><code>/api/search?q=technology&limit=20</code></li>
-            <li><code>/api/statistics</code></li>
-        </ul>
-        
-        <h2>📊 Response Format</h2>
-        <pre>{
-  "status": "success",
-  "message": "Success", 
-  "data": { ... },
-  "timestamp": "2025-05-28T10:30:00"
-}</pre>
-        
-        <p><strong>Built with:</strong> Flask, SQLite, Python</p>
-    </body>
-    </html>
-    """
-    return html_template
+    return app.send_static_file('index.html')
 
 @app.route('/api/articles', methods=['GET'])
 @handle_errors
 def get_articles():
     """Get articles with filtering and pagination"""
-    # Get query parameters
-    country = get_query_param('country')
-    source = get_query_param('source')
-    language = get_query_param('language')
-    date_from = get_query_param('date_from')
-    date_to = get_query_param('date_to')
-    search = get_query_param('search')
-    limit = get_query_param('limit', 100, int)
-    offset = get_query_param('offset', 0, int)
-    sort_by = get_query_param('sort_by', 'publication_date')
-    sort_order = get_query_param('sort_order', 'DESC')
-    
-    # Validate parameters
-    limit = min(max(1, limit), 1000)  # Between 1 and 1000
-    offset = max(0, offset)  # Non-negative
+    # Parse and validate query parameters
+    query = ArticleQuery.from_args(request.args)
+    limit = query.limit
+    
+    # Bulk exports: one article per line, without the envelope or pagination
+    if request.args.get('format') == 'ndjson':
+        articles, _ = news_api.get_articles(**asdict(query), with_count=False)
+        return stream_ndjson(articles)
     
     # Get articles
-    articles, total_count = news_api.get_articles(
-        country=country,
-        source=source,
-        language=language,
-        date_from=date_from,
-        date_to=date_to,
-        search=search,
-        limit=limit,
-        offset=offset,
-        sort_by=sort_by,
-        sort_order=sort_order
-    )
-    
-    # Prepare response
-    response_data = {
-        'articles': articles,
-        'pagination': {
+    articles, total_count = news_api.get_articles(**asdict(query))
+    
+    # Remember the last streamed row so the next keyset cursor can be reported
+    page = {'count': 0, 'last': None}
+    
+    def track_last(rows):
+        for row in rows:
+            page['count'] += 1
+            page['last'] = row
+            yield row
+    
+    def pagination():
+        next_cursor = None
+        if page['count'] == limit and (query.keyset or query.sort_by == 'publication_date'):
+            next_cursor = {
+                'after_date': page['last']['publication_date'],
+                'after_id': page['last']['id']
+            }
+        
+        if query.keyset:
+            return {'pagination': {
+                'limit': limit,
+                'next_cursor': next_cursor
+            }}
+        return {'pagination': {
             'total': total_count,
             'limit': limit,
-            'offset': offset,
+            'offset': query.offset,
             'pages': (total_count + limit - 1) // limit,
-            'current_page': (offset // limit) + 1
-        },
+            'current_page': (query.offset // limit) + 1,
+            'next_cursor': next_cursor
+        }}
+    
+    # Prepare response; articles are streamed into it straight from the cursor
+    response_data = {
         'filters': {
-            'country': country,
-            'source': source,
-            'language': language,
-            'date_from': date_from,
-            'date_to': date_to,
-            'search': search
+            'country': query.country,
+            'source': query.source,
+            'language': query.language,
+            'date_from': query.date_from,
+            'date_to': query.date_to,
+            'search': query.search
         }
     }
     
-    return format_response(response_data, f"Retrieved {len(articles)} articles")
+    return stream_response(track_last(articles), "Retrieved {count} articles", response_data, 'articles',
+                           trailing_data=pagination)
 
 @app.route('/api/articles/<int:article_id>', methods=['GET'])
 @handle_errors
@@ -444,59 +1044,29 @@ def search_articles():
     articles = news_api.search_articles(query, limit)
     
     response_data = {
-        'query': query,
-        'results': articles,
-        'count': len(articles)
+        'query': query
     }
     
-    return format_response(response_data, f"Found {len(articles)} articles")
+    return stream_response(articles, "Found {count} articles", response_data, 'results', count_key='count')
 
 @app.route('/api/statistics', methods=['GET'])
 @handle_errors
 def get_statistics():
     """Get comprehensive statistics"""
-    stats = news_api.get_statistics()
-    return format_response(stats, "Statistics retrieved successfully")
+    return format_cached_response(news_api.get_statistics, "Statistics retrieved successfully")
 
 @app.route('/api/countries', methods=['GET'])
 @handle_errors
 def get_countries():
     """Get list of available countries"""
-    with news_api.get_connection() as conn:
-        cursor = conn.execute("""
-            SELECT country, COUNT(*) as article_count 
-            FROM news_articles 
-            GROUP BY country 
-            ORDER BY article_count DESC
-        """)
-        countries = [{'country': row[0], 'article_count': row[1]} for row in cursor.fetchall()]
-    
-    return format_response(countries, f"Retrieved {len(countries)} countries")
+    return format_cached_response(news_api.get_countries, "Retrieved {count} countries")
 
 @app.route('/api/sources', methods=['GET'])
 @handle_errors
 def get_sources():
     """Get list of available news sources"""
     country = get_query_param('country')
-    
-    query = """
-        SELECT source, country, COUNT(*) as article_count 
-        FROM news_articles 
-    """
-    params = []
-    
-    if country:
-        query += " WHERE country = ?"
-        params.append(country)
-    
-    query += " GROUP BY source, country ORDER BY article_count DESC"
-    
-    with news_api.get_connection() as conn:
-        cursor = conn.execute(query, params)
-        sources = [{'source': row[0], 'country': row[1], 'article_count': row[2]} 
-                  for row in cursor.fetchall()]
-    
-    return format_response(sources, f"Retrieved {len(sources)} sources")
+    return format_cached_response(lambda: news_api.get_sources(country), "Retrieved {count} sources")
 
 @app.route('/api/health', methods=['GET'])
 @handle_errors
@@ -504,9 +1074,9 @@ def health_check():
     """Health check endpoint"""
     try:
         # Test database connection
-        with news_api.get_connection() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM news_articles")
-            article_count = cursor.fetchone()[0]
+        conn = news_api.get_connection()
+        cursor = conn.execute("SELECT COUNT(*) FROM news_articles")
+        article_count = cursor.fetchone()[0]
         
         health_data = {
             'status': 'healthy',
@@ -537,7 +1107,13 @@ def internal_error(error):
     return format_response(None, "Internal server error", 500)
 
 # Development configuration
+# In production, serve the app with a threaded WSGI server instead, e.g.
+#   gunicorn -k gthread -w 2 --threads 8 api.api:app
+#   waitress-serve --threads=8 api.api:app   (Windows)
+# Threads share each worker's SQLite page cache and pooled connections.
 if __name__ == '__main__':
+    logger.warning("Running the Flask development server - do not use it in production. "
+                   "Use e.g. 'gunicorn -k gthread -w 2 --threads 8 api.api:app' instead.")
     print("🚀 Starting Global News API Server...")
     print("📖 API Documentation: http://localhost:5000/")
     print("🔍 Example endpoint: http://localhost:5000/api/articles")
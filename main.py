@@ -10,38 +10,99 @@ Author: RSS News Scraper
 Date: 2025
 """
 
+from __future__ import annotations
+
 import feedparser
-import requests
-import pandas as pd
+import asyncio
+import aiohttp
 import sqlite3
-import json
+import orjson
 import csv
-from datetime import datetime, timedelta
+import html
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from urllib.parse import urljoin, urlparse
 import time
+import atexit
 import logging
-from typing import List, Dict, Optional
+import multiprocessing
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Iterable, Iterator, List, Dict, Mapping, Optional, Set, Tuple
 import re
 from dataclasses import dataclass
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import langdetect
-from langdetect import detect
-import schedule
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import threading
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('news_scraper.log'),
+try:
+    import brotli  # noqa: F401 - lets aiohttp decode Brotli-compressed feeds
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import gcld3  # Native CLD3 language identification, far faster than langdetect
+except ImportError:
+    gcld3 = None
+
+try:
+    from lxml import etree  # Streaming feed parser; feedparser is the fallback
+except ImportError:
+    etree = None
+
+try:
+    import uvloop  # libuv-based event loop for the fetch fan-out (not on Windows)
+except ImportError:
+    uvloop = None
+
+# Patterns used by NewsRSSScraper._clean_text, compiled once
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+ELLIPSIS_RE = re.compile(r'\.{3,}')
+
+def run_async(coro):
+    """Run a coroutine to completion on uvloop when installed, else on asyncio's default loop"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+# Per-thread CLD3 identifiers; instances are not shared between threads
+_language_identifiers = threading.local()
+
+# Feed elements read by NewsRSSScraper._parse_rss_stream: RSS items and Atom entries
+FEED_ITEM_TAGS = ('{*}item', '{*}entry')
+FEED_SUMMARY_TAGS = ('description', 'summary')
+# title, link and summary elements only count in these namespaces (None is
+# plain RSS 2.0), so extensions such as <media:title> are not mistaken for them
+FEED_CORE_NAMESPACES = (None, 'http://www.w3.org/2005/Atom', 'http://purl.org/rss/1.0/',
+                        'http://my.netscape.com/rdf/simple/0.9/')
+FEED_CONTENT_TAGS = ('encoded', 'content')
+FEED_PUBLISHED_TAGS = ('pubDate', 'published', 'date', 'issued')
+FEED_UPDATED_TAGS = ('updated', 'modified')
+
+# Configure logging. Records are queued and written by one listener thread,
+# so fetching and parsing never wait on file or console I/O. Parser worker
+# processes forward their records to this process (see _init_worker_logging).
+if multiprocessing.parent_process() is None:
+    log_queue = queue.Queue(-1)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[QueueHandler(log_queue)]
+    )
+    log_listener = QueueListener(
+        log_queue,
+        RotatingFileHandler('news_scraper.log', maxBytes=10_000_000, backupCount=3),
         logging.StreamHandler()
-    ]
-)
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
     """Data class for storing news article information"""
     title: str
@@ -53,23 +114,55 @@ class NewsArticle:
     language: str = "unknown"
     category: str = "general"
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for easy serialization"""
-        return {
-            'title': self.title,
-            'publication_date': self.publication_date,
-            'source': self.source,
-            'country': self.country,
-            'summary': self.summary,
-            'url': self.url,
-            'language': self.language,
-            'category': self.category
-        }
+    @staticmethod
+    def compute_hash(title: str, url: str, publication_date: str) -> int:
+        """
+        Generate unique hash for duplicate detection
+        
+        A 64-bit BLAKE2b digest of title, url and publication date, returned
+        as a signed integer so it fits an SQLite INTEGER.
+        """
+        content = b'\x1f'.join((title.encode('utf-8'),
+                                 url.encode('utf-8'),
+                                 publication_date.encode('utf-8')))
+        digest = hashlib.blake2b(content, digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+class ArticleStore:
+    """
+    Column-oriented storage for scraped articles
+    
+    Keeps one list per NewsArticle field rather than one object per
+    article, so each stored article costs a few list
+    slots instead of a full instance. Saving, exporting and statistics
+    read whole columns at once. Articles whose URL is already stored are
+    skipped.
+    """
+    
+    FIELDS = ('title', 'publication_date', 'source', 'country',
+              'summary', 'url', 'language', 'category')
+    
+    def __init__(self):
+        self.columns: Dict[str, list] = {name: [] for name in self.FIELDS}
+        self.urls: Set[str] = set()
+    
+    def __len__(self) -> int:
+        return len(self.columns['title'])
     
-    def get_hash(self) -> str:
-        """Generate unique hash for duplicate detection"""
-        content = f"{self.title}{self.url}{self.publication_date}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+    def append(self, article: NewsArticle) -> None:
+        if article.url in self.urls:
+            return
+        self.urls.add(article.url)
+        for name in self.FIELDS:
+            self.columns[name].append(getattr(article, name))
+    
+    def extend(self, articles: Iterable[NewsArticle]) -> None:
+        for article in articles:
+            self.append(article)
+    
+    def rows(self, fields: Tuple[str, ...] = FIELDS) -> Iterator[tuple]:
+        """Iterate over articles as tuples of the given columns"""
+        return zip(*(self.columns[name] for name in fields))
 
 class GlobalNewsRSSConfig:
     """Configuration class containing RSS feeds for different countries"""
@@ -188,10 +281,17 @@ class GlobalNewsRSSConfig:
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Accept': 'application/rss+xml, application/xml, text/xml',
         'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',
+        'Accept-Encoding': ACCEPT_ENCODING,
         'Connection': 'keep-alive',
         'Upgrade-Insecure-Requests': '1'
     }
+    
+    # Connection limits and retry policy for feed fetching
+    MAX_CONNECTIONS = 100
+    MAX_CONNECTIONS_PER_HOST = 2
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # Seconds, doubled on every further retry
+    RETRY_STATUSES = (429, 502, 503, 504)
 
 class NewsRSSScraper:
     """Main scraper class for collecting news from RSS feeds"""
@@ -202,23 +302,43 @@ class NewsRSSScraper:
         
         Args:
             db_path: Path to SQLite database file
-            rate_limit: Delay between requests in seconds
+            rate_limit: Minimum delay between requests to the same host in seconds
         """
         self.db_path = db_path
         self.rate_limit = rate_limit
-        self.articles: List[NewsArticle] = []
-        self.seen_hashes = set()
+        self.articles = ArticleStore()
         self.config = GlobalNewsRSSConfig()
-        self.session = requests.Session()
-        self.session.headers.update(self.config.HEADERS)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_fetch: Dict[str, float] = {}  # Earliest monotonic start time per host
         
         # Initialize database
         self._init_database()
+        
+        # ETag / Last-Modified validators per feed URL for conditional requests.
+        # New validators are only persisted by save_to_database, together with
+        # the articles they cover.
+        self.feed_cache = self._load_feed_cache()
+        self.feed_cache_updates: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a database connection tuned for bulk writes
+        
+        synchronous=NORMAL is safe under WAL: a crash can lose the last
+        commit but never corrupts the database.
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')  # 64 MB
+        return conn
     
     def _init_database(self):
         """Initialize SQLite database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
+            # WAL is persistent; it lets the API keep reading while we write
+            cursor.execute('PRAGMA journal_mode=WAL')
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS news_articles (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -230,33 +350,78 @@ class NewsRSSScraper:
                     url TEXT UNIQUE NOT NULL,
                     language TEXT,
                     category TEXT,
-                    hash TEXT UNIQUE,
+                    hash INTEGER UNIQUE,
                     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
             
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_country ON news_articles(country);
-            ''')
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_source ON news_articles(source);
+                CREATE INDEX IF NOT EXISTS idx_date ON news_articles(publication_date);
             ''')
+            
             cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_date ON news_articles(publication_date);
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    last_fetch TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
             ''')
             conn.commit()
         logger.info("Database initialized successfully")
     
-    def _detect_language(self, text: str) -> str:
-        """Detect language of given text"""
+    def _load_feed_cache(self) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """Load stored (etag, last_modified) validators keyed by feed URL"""
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT url, etag, last_modified FROM feed_cache")
+            return {url: (etag, last_modified) for url, etag, last_modified in cursor}
+    
+    def _save_feed_cache(self, conn: sqlite3.Connection) -> None:
+        """Persist validators of feeds fetched since the last save"""
+        if not self.feed_cache_updates:
+            return
+        
+        conn.executemany('''
+            INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, last_fetch)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+        ''', [(url, etag, last_modified) for url, (etag, last_modified) in self.feed_cache_updates.items()])
+        
+        self.feed_cache.update(self.feed_cache_updates)
+        self.feed_cache_updates = {}
+    
+    @staticmethod
+    def _language_identifier():
+        """Get this thread's CLD3 identifier"""
+        identifier = getattr(_language_identifiers, 'identifier', None)
+        if identifier is None:
+            identifier = gcld3.NNetLanguageIdentifier(min_num_bytes=10, max_num_bytes=1000)
+            _language_identifiers.identifier = identifier
+        return identifier
+    
+    @classmethod
+    def _detect_language(cls, text: str) -> str:
+        """
+        Detect language of given text
+        
+        Uses CLD3 when gcld3 is installed and falls back to langdetect when
+        it is missing or CLD3 is not confident about the text.
+        """
         try:
             if text and len(text.strip()) > 10:
+                if gcld3 is not None:
+                    result = cls._language_identifier().FindLanguage(text=text)
+                    if result.is_reliable:
+                        return result.language
+                
+                # Imported lazily: only needed when CLD3 is missing or unsure
+                from langdetect import detect
                 return detect(text)
         except:
             pass
         return "unknown"
     
-    def _parse_date(self, date_str: str) -> str:
+    @staticmethod
+    def _parse_date(date_str: str) -> str:
         """Parse and standardize date format"""
         if not date_str:
             return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -282,81 +447,232 @@ class NewsRSSScraper:
         
         return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
-    def _clean_text(self, text: str) -> str:
+    @staticmethod
+    def _parse_feed_date(value: str) -> Optional[time.struct_time]:
+        """Parse an RFC 822 or ISO 8601 feed date into a UTC struct_time"""
+        for parse in (parsedate_to_datetime, datetime.fromisoformat):
+            try:
+                dt = parse(value.strip())
+            except (TypeError, ValueError):
+                continue
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc)
+            return dt.timetuple()
+        return None
+    
+    @classmethod
+    def _parse_rss_stream(cls, content: bytes) -> List[feedparser.FeedParserDict]:
+        """
+        Stream-parse feed entries with lxml, keeping only the fields we use
+        
+        Handles RSS items and Atom entries. Every entry element is cleared
+        once read, so no full document tree is built. Entries mimic
+        feedparser's (title, link, summary, published/updated and their
+        parsed forms) so _extract_entries can consume either.
+        
+        Raises:
+            etree.XMLSyntaxError: If the content is not well-formed XML
+        """
+        entries = []
+        
+        for _, elem in etree.iterparse(BytesIO(content), events=('end',), tag=FEED_ITEM_TAGS,
+                                       resolve_entities=False, no_network=True):
+            entry = feedparser.FeedParserDict()
+            content_text = None
+            permalink = None
+            
+            for child in elem:
+                if not isinstance(child.tag, str):
+                    continue  # Comments and processing instructions
+                qname = etree.QName(child)
+                name = qname.localname
+                core = qname.namespace in FEED_CORE_NAMESPACES
+                
+                if name == 'link' and core:
+                    # RSS links are element text; Atom links are href attributes
+                    if 'link' not in entry and child.get('rel', 'alternate') == 'alternate':
+                        entry['link'] = (child.get('href') or child.text or '').strip()
+                elif name == 'title' and core:
+                    entry.setdefault('title', html.unescape(''.join(child.itertext())))
+                elif name in FEED_SUMMARY_TAGS and core:
+                    entry.setdefault('summary', html.unescape(''.join(child.itertext())))
+                elif name == 'guid' and core and child.text and child.get('isPermaLink', 'true') == 'true':
+                    # Like feedparser, a permalink guid stands in for a missing link
+                    permalink = permalink or child.text.strip()
+                elif name in FEED_CONTENT_TAGS:
+                    content_text = content_text or html.unescape(''.join(child.itertext()))
+                elif name in FEED_PUBLISHED_TAGS and child.text:
+                    entry.setdefault('published', child.text.strip())
+                elif name in FEED_UPDATED_TAGS and child.text:
+                    entry.setdefault('updated', child.text.strip())
+            
+            if 'summary' not in entry and content_text:
+                entry['summary'] = content_text
+            if 'link' not in entry and permalink:
+                entry['link'] = permalink
+            for key in ('published', 'updated'):
+                if key in entry:
+                    entry[f'{key}_parsed'] = cls._parse_feed_date(entry[key])
+            entries.append(entry)
+            
+            # Release the entry and any already processed siblings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        
+        return entries
+    
+    @classmethod
+    def _entry_date(cls, entry) -> str:
+        """
+        Get the standardized publication date of a feed entry
+        
+        feedparser already parses dates into a UTC struct_time, so it is
+        formatted directly; string parsing is only the fallback.
+        """
+        parsed = getattr(entry, 'published_parsed', None) or getattr(entry, 'updated_parsed', None)
+        if parsed:
+            return time.strftime('%Y-%m-%d %H:%M:%S', parsed)
+        return cls._parse_date(getattr(entry, 'published', ''))
+    
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """Clean and normalize text content"""
         if not text:
             return ""
         
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = HTML_TAG_RE.sub('', text)
         
         # Normalize whitespace
-        text = ' '.join(text.split())
+        text = WHITESPACE_RE.sub(' ', text)
         
         # Remove excessive punctuation
-        text = re.sub(r'[.]{3,}', '...', text)
+        text = ELLIPSIS_RE.sub('...', text)
         
         return text.strip()
     
-    def _fetch_rss_feed(self, url: str, timeout: int = 30) -> Optional[feedparser.FeedParserDict]:
+    async def _fetch_rss_feed(self, session: aiohttp.ClientSession, url: str,
+                              timeout: int = 30) -> Optional[Tuple[bytes, Mapping[str, str]]]:
         """
-        Fetch and parse RSS feed from URL
+        Fetch raw RSS feed content from URL, rate limited per host
         
         Args:
+            session: Shared aiohttp session
             url: RSS feed URL
             timeout: Request timeout in seconds
-            
+        
         Returns:
-            Parsed feed data or None if failed
+            Tuple of (content, response headers), or None if the feed is
+            unchanged or fetching failed
         """
-        try:
-            logger.info(f"Fetching RSS feed: {url}")
-            
-            # Add delay for rate limiting
-            time.sleep(self.rate_limit)
-            
-            response = self.session.get(url, timeout=timeout)
-            response.raise_for_status()
+        headers = {}
+        etag, last_modified = self.feed_cache.get(url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        host = urlparse(url).netloc
+        semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.config.MAX_CONNECTIONS_PER_HOST))
+        
+        async with semaphore:
+            logger.debug(f"Fetching RSS feed: {url}")
             
-            # Parse feed
-            feed = feedparser.parse(response.content)
+            for attempt in range(self.config.MAX_RETRIES + 1):
+                # Retries take a fresh slot too, so they keep to rate_limit
+                backoff = self.config.RETRY_BACKOFF * 2 ** (attempt - 1) if attempt else 0
+                await self._wait_for_slot(host, backoff)
+                
+                try:
+                    async with session.get(url, headers=headers,
+                                           timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        if response.status == 304:
+                            logger.debug(f"Feed not modified, skipping: {url}")
+                            return None
+                        if response.status in self.config.RETRY_STATUSES and attempt < self.config.MAX_RETRIES:
+                            continue
+                        response.raise_for_status()
+                        return await response.read(), response.headers
+                
+                except aiohttp.ClientResponseError as e:
+                    logger.error(f"HTTP error fetching {url}: {e.status} {e.message}")
+                    return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    if attempt == self.config.MAX_RETRIES:
+                        logger.error(f"Network error fetching {url}: {type(e).__name__}: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected error fetching {url}: {e}")
+                    return None
+        
+        return None
+    
+    async def _wait_for_slot(self, host: str, delay: float = 0) -> None:
+        """Wait at least delay seconds and until the host's next start slot, reserving it"""
+        # No await between reading and updating the slot, so no lock is needed
+        now = time.monotonic()
+        start = max(now + delay, self._next_fetch.get(host, now))
+        self._next_fetch[host] = start + self.rate_limit
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    @classmethod
+    def _parse_feed(cls, content: bytes, source: str,
+                    content_type: str = '') -> List[Tuple[str, str, str, str]]:
+        """
+        Parse fetched feed content and extract its entries
+        
+        Well-formed feeds are stream-parsed with lxml; feedparser handles
+        malformed XML and formats the streaming parser finds no entries in.
+        Uses no scraper state, so it can run in a worker process.
+        
+        feedparser is given the response Content-Type for charset detection
+        and skips HTML sanitizing and relative URI resolution: _clean_text
+        strips markup anyway and only absolute entry links are stored.
+        """
+        entries = None
+        if etree is not None:
+            try:
+                entries = cls._parse_rss_stream(content)
+            except etree.XMLSyntaxError as e:
+                logger.debug(f"Streaming parse failed for {source}, falling back to feedparser: {e}")
+        
+        if entries:
+            feed = feedparser.FeedParserDict(entries=entries)
+        else:
+            feed = feedparser.parse(content, response_headers={'content-type': content_type},
+                                    sanitize_html=False, resolve_relative_uris=False)
             
             if feed.bozo:
-                logger.warning(f"Feed parsing issues for {url}: {feed.bozo_exception}")
-            
-            return feed
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Network error fetching {url}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error fetching {url}: {e}")
+                logger.warning(f"Feed parsing issues for {source}: {feed.bozo_exception}")
         
-        return None
+        return cls._extract_entries(feed, source)
     
-    def _extract_articles_from_feed(self, feed: feedparser.FeedParserDict, 
-                                  source: str, country: str) -> List[NewsArticle]:
+    @classmethod
+    def _extract_entries(cls, feed: feedparser.FeedParserDict,
+                         source: str) -> List[Tuple[str, str, str, str]]:
         """
-        Extract articles from parsed RSS feed
+        Extract article fields from parsed RSS feed
         
         Args:
             feed: Parsed RSS feed data
             source: News source name
-            country: Country name
-            
+        
         Returns:
-            List of extracted NewsArticle objects
+            List of (title, publication_date, summary, url) tuples
         """
-        articles = []
+        entries = []
         
         if not hasattr(feed, 'entries') or not feed.entries:
             logger.warning(f"No entries found in feed from {source}")
-            return articles
+            return entries
         
         for entry in feed.entries:
             try:
                 # Extract basic information
-                title = self._clean_text(getattr(entry, 'title', ''))
-                summary = self._clean_text(getattr(entry, 'summary', ''))
+                title = cls._clean_text(getattr(entry, 'title', ''))
+                summary = cls._clean_text(getattr(entry, 'summary', ''))
                 url = getattr(entry, 'link', '')
                 
                 # Skip if essential fields are missing
@@ -364,137 +680,182 @@ class NewsRSSScraper:
                     continue
                 
                 # Parse publication date
-                pub_date = self._parse_date(getattr(entry, 'published', ''))
-                
-                # Create article object
-                article = NewsArticle(
-                    title=title,
-                    publication_date=pub_date,
-                    source=source,
-                    country=country,
-                    summary=summary,
-                    url=url
-                )
-                
-                # Detect language
-                text_for_lang = f"{title} {summary}"
-                article.language = self._detect_language(text_for_lang)
-                
-                # Check for duplicates
-                article_hash = article.get_hash()
-                if article_hash not in self.seen_hashes:
-                    self.seen_hashes.add(article_hash)
-                    articles.append(article)
-                
+                entries.append((title, cls._entry_date(entry), summary, url))
+            
             except Exception as e:
                 logger.error(f"Error extracting article from {source}: {e}")
                 continue
         
-        logger.info(f"Extracted {len(articles)} articles from {source}")
+        return entries
+    
+    @staticmethod
+    def _build_articles(entries: List[Tuple[str, str, str, str, str]],
+                        source: str, country: str) -> List[NewsArticle]:
+        """Build articles from processed (title, publication_date, summary, url, language) entries"""
+        return [
+            NewsArticle(
+                title=title,
+                publication_date=pub_date,
+                source=source,
+                country=country,
+                summary=summary,
+                url=url,
+                language=language
+            )
+            for title, pub_date, summary, url, language in entries
+        ]
+    
+    async def _scrape_feed(self, session: aiohttp.ClientSession, executor: ProcessPoolExecutor,
+                           feed_info: Dict, country: str) -> List[NewsArticle]:
+        """
+        Fetch one feed and process it
+        
+        Parsing and language detection run together as one process pool
+        task, so they use every core while the event loop keeps fetching.
+        """
+        feed_name = feed_info['name']
+        feed_url = feed_info['url']
+        
+        fetched = await self._fetch_rss_feed(session, feed_url)
+        if fetched is None:
+            return []
+        content, headers = fetched
+        
+        try:
+            loop = asyncio.get_running_loop()
+            entries = await loop.run_in_executor(executor, process_feed, content, feed_name,
+                                                 headers.get('Content-Type', ''))
+            articles = self._build_articles(entries, feed_name, country)
+        except Exception as e:
+            logger.error(f"Error processing feed {feed_name} ({country}): {e}")
+            return []
+        
+        logger.debug(f"Extracted {len(articles)} articles from {feed_name}")
+        
+        # Only remember validators once the content behind them was processed
+        if 'ETag' in headers or 'Last-Modified' in headers:
+            self.feed_cache_updates[feed_url] = (headers.get('ETag'), headers.get('Last-Modified'))
         return articles
     
+    async def _scrape_countries(self, countries: List[str],
+                                max_workers: Optional[int]) -> List[Tuple[str, List[NewsArticle]]]:
+        """
+        Fetch the feeds of all given countries concurrently on one event loop
+        
+        Returns:
+            List of (country, articles) pairs in completion order
+        """
+        self._host_semaphores = {}
+        connector = aiohttp.TCPConnector(limit=self.config.MAX_CONNECTIONS,
+                                         limit_per_host=self.config.MAX_CONNECTIONS_PER_HOST)
+        
+        # Worker log records are handed to this process's own handlers
+        root_logger = logging.getLogger()
+        worker_logs = multiprocessing.Queue()
+        worker_log_listener = QueueListener(worker_logs, *root_logger.handlers)
+        worker_log_listener.start()
+        
+        try:
+            async with aiohttp.ClientSession(connector=connector, headers=self.config.HEADERS) as session:
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_logging,
+                                         initargs=(worker_logs, root_logger.level)) as executor:
+                    async def scrape_country(country: str) -> Tuple[str, List[NewsArticle]]:
+                        feeds = self.config.RSS_FEEDS[country]
+                        logger.info(f"Starting to scrape {len(feeds)} feeds for {country}")
+                        
+                        results = await asyncio.gather(
+                            *(self._scrape_feed(session, executor, feed_info, country) for feed_info in feeds))
+                        country_articles = [article for articles in results for article in articles]
+                        
+                        logger.info(f"Total articles scraped for {country}: {len(country_articles)}")
+                        return country, country_articles
+                    
+                    return [await task for task in asyncio.as_completed([scrape_country(c) for c in countries])]
+        finally:
+            worker_log_listener.stop()
+    
     def scrape_country_feeds(self, country: str) -> List[NewsArticle]:
         """
         Scrape all RSS feeds for a specific country
         
         Args:
             country: Country name
-            
+        
         Returns:
             List of scraped articles
         """
-        country_articles = []
-        
         if country not in self.config.RSS_FEEDS:
             logger.warning(f"No RSS feeds configured for {country}")
-            return country_articles
-        
-        feeds = self.config.RSS_FEEDS[country]
-        logger.info(f"Starting to scrape {len(feeds)} feeds for {country}")
-        
-        for feed_info in feeds:
-            feed_name = feed_info['name']
-            feed_url = feed_info['url']
-            
-            try:
-                # Fetch and parse feed
-                feed = self._fetch_rss_feed(feed_url)
-                if not feed:
-                    continue
-                
-                # Extract articles
-                articles = self._extract_articles_from_feed(feed, feed_name, country)
-                country_articles.extend(articles)
-                
-            except Exception as e:
-                logger.error(f"Error processing feed {feed_name} ({country}): {e}")
-                continue
+            return []
         
-        logger.info(f"Total articles scraped for {country}: {len(country_articles)}")
+        [(_, country_articles)] = run_async(self._scrape_countries([country], max_workers=1))
         return country_articles
     
-    def scrape_all_countries(self, max_workers: int = 5) -> None:
+    def scrape_all_countries(self, max_workers: Optional[int] = None) -> None:
         """
-        Scrape RSS feeds from all configured countries using threading
+        Scrape RSS feeds from all configured countries
+        
+        Feeds are fetched concurrently with asyncio; parsing and language
+        detection run in a process pool.
         
         Args:
-            max_workers: Maximum number of concurrent threads
+            max_workers: Maximum number of parsing processes (default: CPU count)
         """
         logger.info("Starting to scrape all countries...")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit tasks for each country
-            future_to_country = {
-                executor.submit(self.scrape_country_feeds, country): country 
-                for country in self.config.RSS_FEEDS.keys()
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_country):
-                country = future_to_country[future]
-                try:
-                    articles = future.result()
-                    self.articles.extend(articles)
-                    logger.info(f"Completed scraping for {country}: {len(articles)} articles")
-                except Exception as e:
-                    logger.error(f"Error scraping {country}: {e}")
+        # Each run starts a fresh store, so scheduled runs don't accumulate
+        self.articles = ArticleStore()
+        results = run_async(self._scrape_countries(list(self.config.RSS_FEEDS), max_workers))
+        for country, articles in results:
+            self.articles.extend(articles)
+            logger.info(f"Completed scraping for {country}: {len(articles)} articles")
         
         logger.info(f"Scraping completed. Total articles: {len(self.articles)}")
     
     def save_to_database(self) -> None:
-        """Save scraped articles to SQLite database"""
+        """
+        Save scraped articles and feed validators to SQLite database
+        
+        Validators are only committed together with the articles, so a
+        failed save leaves the feeds to be fetched in full next time.
+        """
         if not self.articles:
             logger.warning("No articles to save")
+            with self._connect() as conn:
+                self._save_feed_cache(conn)
             return
         
+        # Duplicates are left to INSERT OR IGNORE on the UNIQUE url and hash
+        # columns, so hashes are only computed here, at write time
+        rows = [
+            (title, publication_date, source, country, summary, url, language, category,
+             NewsArticle.compute_hash(title, url, publication_date))
+            for title, publication_date, source, country, summary, url, language, category
+            in self.articles.rows()
+        ]
+        
         saved_count = 0
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
-            for article in self.articles:
-                try:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO news_articles 
-                        (title, publication_date, source, country, summary, url, language, category, hash)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        article.title,
-                        article.publication_date,
-                        article.source,
-                        article.country,
-                        article.summary,
-                        article.url,
-                        article.language,
-                        article.category,
-                        article.get_hash()
-                    ))
-                    
-                    if cursor.rowcount > 0:
-                        saved_count += 1
-                        
-                except sqlite3.Error as e:
-                    logger.error(f"Database error saving article: {e}")
+            try:
+                # One statement and one transaction for the whole batch
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO news_articles 
+                    (title, publication_date, source, country, summary, url, language, category, hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                saved_count = cursor.rowcount
             
+            except sqlite3.Error as e:
+                logger.error(f"Database error saving articles: {e}")
+                # Discard the rows inserted before the error, and keep the new
+                # validators pending: committing them without the articles
+                # would make those feeds answer 304 from now on
+                conn.rollback()
+                return
+            
+            self._save_feed_cache(conn)
             conn.commit()
         
         logger.info(f"Saved {saved_count} new articles to database")
@@ -506,8 +867,10 @@ class NewsRSSScraper:
             return
         
         try:
-            df = pd.DataFrame([article.to_dict() for article in self.articles])
-            df.to_csv(filename, index=False, encoding='utf-8')
+            with open(filename, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(ArticleStore.FIELDS)
+                writer.writerows(self.articles.rows())
             logger.info(f"Exported {len(self.articles)} articles to {filename}")
         except Exception as e:
             logger.error(f"Error exporting to CSV: {e}")
@@ -522,70 +885,88 @@ class NewsRSSScraper:
             data = {
                 'scraped_at': datetime.now().isoformat(),
                 'total_articles': len(self.articles),
-                'articles': [article.to_dict() for article in self.articles]
+                'articles': [dict(zip(ArticleStore.FIELDS, row)) for row in self.articles.rows()]
             }
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # orjson writes UTF-8 bytes directly, like ensure_ascii=False
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             
             logger.info(f"Exported {len(self.articles)} articles to {filename}")
         except Exception as e:
             logger.error(f"Error exporting to JSON: {e}")
     
+    def _count_articles(self) -> Tuple[Counter, Counter, Counter]:
+        """Count articles by country, source and language"""
+        columns = self.articles.columns
+        return Counter(columns['country']), Counter(columns['source']), Counter(columns['language'])
+    
     def get_statistics(self) -> Dict:
         """Generate statistics about scraped articles"""
         if not self.articles:
             return {}
         
-        # Count by country
-        country_counts = {}
-        source_counts = {}
-        language_counts = {}
-        
-        for article in self.articles:
-            country_counts[article.country] = country_counts.get(article.country, 0) + 1
-            source_counts[article.source] = source_counts.get(article.source, 0) + 1
-            language_counts[article.language] = language_counts.get(article.language, 0) + 1
+        country_counts, source_counts, language_counts = self._count_articles()
         
         return {
             'total_articles': len(self.articles),
             'countries': len(country_counts),
             'sources': len(source_counts),
-            'articles_by_country': dict(sorted(country_counts.items(), key=lambda x: x[1], reverse=True)),
-            'articles_by_source': dict(sorted(source_counts.items(), key=lambda x: x[1], reverse=True)),
-            'articles_by_language': dict(sorted(language_counts.items(), key=lambda x: x[1], reverse=True))
+            'articles_by_country': dict(country_counts.most_common()),
+            'articles_by_source': dict(source_counts.most_common()),
+            'articles_by_language': dict(language_counts.most_common())
         }
     
     def print_statistics(self) -> None:
         """Print comprehensive statistics"""
-        stats = self.get_statistics()
-        
-        if not stats:
+        if not self.articles:
             print("No statistics available - no articles scraped")
             return
         
+        # Top-10 lists use most_common(n), a heap selection rather than a full sort
+        country_counts, source_counts, language_counts = self._count_articles()
+        
         print("\n" + "="*60)
         print("GLOBAL NEWS SCRAPING STATISTICS")
         print("="*60)
-        print(f"Total Articles: {stats['total_articles']}")
-        print(f"Countries Covered: {stats['countries']}")
-        print(f"News Sources: {stats['sources']}")
+        print(f"Total Articles: {len(self.articles)}")
+        print(f"Countries Covered: {len(country_counts)}")
+        print(f"News Sources: {len(source_counts)}")
         
         print("\nTop 10 Countries by Article Count:")
         print("-" * 40)
-        for country, count in list(stats['articles_by_country'].items())[:10]:
+        for country, count in country_counts.most_common(10):
             print(f"{country:<25} {count:>6}")
         
         print("\nTop 10 News Sources:")
         print("-" * 40)
-        for source, count in list(stats['articles_by_source'].items())[:10]:
+        for source, count in source_counts.most_common(10):
             print(f"{source:<25} {count:>6}")
         
         print("\nLanguage Distribution:")
         print("-" * 40)
-        for language, count in stats['articles_by_language'].items():
+        for language, count in language_counts.most_common():
             print(f"{language:<15} {count:>6}")
 
+def _init_worker_logging(records: multiprocessing.Queue, level: int) -> None:
+    """Process pool initializer: send this worker's log records to the parent process"""
+    root_logger = logging.getLogger()
+    root_logger.handlers = [QueueHandler(records)]
+    root_logger.setLevel(level)
+
+def process_feed(content: bytes, source: str,
+                 content_type: str = '') -> List[Tuple[str, str, str, str, str]]:
+    """
+    Process pool task: parse feed content and detect each entry's language
+    
+    Returns:
+        List of (title, publication_date, summary, url, language) tuples
+    """
+    return [
+        (title, pub_date, summary, url, NewsRSSScraper._detect_language(f"{title} {summary}"))
+        for title, pub_date, summary, url in NewsRSSScraper._parse_feed(content, source, content_type)
+    ]
+
 class NewsScheduler:
     """Scheduler for automated news scraping"""
     
@@ -595,6 +976,8 @@ class NewsScheduler:
     
     def start_scheduled_scraping(self, interval_hours: int = 6):
         """Start scheduled scraping every N hours"""
+        import schedule  # Only needed by long-running scheduled deployments
+        
         def run_scraper():
             logger.info("Starting scheduled news scraping...")
             self.scraper.scrape_all_countries()